@@ -33,6 +33,14 @@ def reset() -> None:
     _create_all_tables()
 
 
+def dispose() -> None:
+    """ Close all pooled connections. Call before forking processes that will also
+    use the DB, so that parent and children do not share connections
+    """
+    if _engine is not None:
+        _engine.dispose()
+
+
 @contextmanager
 def session_scope() -> Generator[Session, None, None]:
     """ Gives a context in which to perform database